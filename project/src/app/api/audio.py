@@ -20,27 +20,31 @@ async def list_audio_files():
         # Ensure directory exists
         AUDIO_DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
 
-        files = []
-        for file_path in AUDIO_DOWNLOADS_DIR.iterdir():
-            if file_path.is_file():
-                # Get file stats
-                stat = file_path.stat()
+        # Collect (mtime, name, stat) with a single stat per file
+        entries = []
+        with os.scandir(AUDIO_DOWNLOADS_DIR) as it:
+            for entry in it:
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat))
 
-                # Determine MIME type
-                mime_type, _ = mimetypes.guess_type(str(file_path))
+        # Sort by raw modified time (newest first) before formatting
+        entries.sort(key=lambda x: x[0], reverse=True)
 
-                files.append({
-                    "name": file_path.name,
-                    "size": stat.st_size,
-                    "size_mb": round(stat.st_size / (1024 * 1024), 2),
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "mime_type": mime_type or "application/octet-stream",
-                    "is_audio": mime_type and mime_type.startswith("audio/") if mime_type else False,
-                    "download_url": f"/audio/download/{file_path.name}"
-                })
-
-        # Sort by modified time (newest first)
-        files.sort(key=lambda x: x["modified"], reverse=True)
+        files = []
+        for mtime, name, stat in entries:
+            # Determine MIME type
+            mime_type, _ = mimetypes.guess_type(name)
+
+            files.append({
+                "name": name,
+                "size": stat.st_size,
+                "size_mb": round(stat.st_size / (1024 * 1024), 2),
+                "modified": datetime.fromtimestamp(mtime).isoformat(),
+                "mime_type": mime_type or "application/octet-stream",
+                "is_audio": mime_type and mime_type.startswith("audio/") if mime_type else False,
+                "download_url": f"/audio/download/{name}"
+            })
 
         return files
 
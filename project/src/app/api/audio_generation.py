@@ -6,27 +6,17 @@ NotebookLM Automation API endpoint
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
-import os
-import sys
 import time
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 
-# Add paths for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-app_dir = os.path.dirname(current_dir)
-core_dir = os.path.join(app_dir, "core")
-automation_dir = os.path.join(app_dir, "services", "automation")
-flow_dir = os.path.join(core_dir, "flow")
-
-sys.path.append(core_dir)
-sys.path.append(automation_dir)
-sys.path.append(flow_dir)
-
-from automate import run_notebooklm_automation
+from ..core.flow.automate import run_notebooklm_automation, run_in_automation_thread
 
 router = APIRouter()
 
+# Longest a request waits in the automation queue before it is turned away
+# (one full run's budget, so it can always wait out the job ahead of it)
+QUEUE_TIMEOUT = 2100
+
 class NotebookLMRequest(BaseModel):
     custom_text: str  # Required custom text input
 
@@ -67,38 +57,14 @@ async def generate_audio_from_text(request: NotebookLMRequest):
         # Run automation in thread pool to avoid sync/async conflict
         print(f"[INFO] Starting NotebookLM automation with custom text", flush=True)
 
+        # Set once the job leaves the queue, so the timeout below only
+        # covers the job's own run, not time spent behind other requests
+        loop = asyncio.get_running_loop()
+        started = asyncio.Event()
+
         def run_automation():
+            loop.call_soon_threadsafe(started.set)
             try:
-                # Check Playwright availability first
-                try:
-                    from playwright.sync_api import sync_playwright
-                    import os
-                    import asyncio
-                    
-                    # Windows-specific fix for subprocess
-                    if os.name == 'nt':  # Windows
-                        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-                    
-                    # Test Playwright installation properly
-                    print(f"[INFO] Testing Playwright installation...", flush=True)
-                    with sync_playwright() as p:
-                        browser_path = p.chromium.executable_path
-                        if not browser_path or not os.path.exists(browser_path):
-                            raise Exception("Playwright Chromium browser not found. Please run: playwright install chromium")
-                        print(f"[SUCCESS] Playwright Chromium found at: {browser_path}", flush=True)
-                except ImportError:
-                    raise Exception("Playwright not installed. Please run: pip install playwright && playwright install chromium")
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if "not found" in error_msg or "chromium" in error_msg:
-                        raise e
-                    elif "target page" in error_msg or "browser has been closed" in error_msg:
-                        print(f"[WARNING] Browser closed during automation: {e}", flush=True)
-                        raise Exception(f"Browser automation interrupted: {e}")
-                    else:
-                        print(f"[ERROR] Playwright error: {e}", flush=True)
-                        raise Exception(f"Playwright setup issue: {e}")
-                
                 # Validate content length
                 if len(custom_text.strip()) < 50:
                     raise Exception(f"Content too short ({len(custom_text.strip())} chars). Minimum 50 characters required for NotebookLM.")
@@ -120,16 +86,34 @@ async def generate_audio_from_text(request: NotebookLMRequest):
                 return False
 
         # Execute in thread pool with timeout
-        loop = asyncio.get_event_loop()
+        # Runs on the automation's own worker thread (sync Playwright is thread-bound)
+        job = asyncio.ensure_future(run_in_automation_thread(run_automation))
+        started_wait = asyncio.ensure_future(started.wait())
         try:
-            with ThreadPoolExecutor() as executor:
-                future = loop.run_in_executor(executor, run_automation)
-                # Increase timeout to 35 minutes to allow 30 min automation + 5 min buffer
-                success = await asyncio.wait_for(future, timeout=2100)  # 35 minutes
+            # Wait to be picked up, but not forever: give up after one full run's
+            # budget, or as soon as the job fails to queue (e.g. executor shut down)
+            done, _ = await asyncio.wait(
+                {started_wait, job}, timeout=QUEUE_TIMEOUT, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                job.cancel()
+                raise HTTPException(
+                    status_code=503,
+                    detail="NotebookLM automation is busy with other requests. Please retry later."
+                )
+            # Increase timeout to 35 minutes to allow 30 min automation + 5 min buffer
+            async with asyncio.timeout(2100):  # 35 minutes
+                success = await job
         except asyncio.TimeoutError:
             print("[ERROR] Automation timed out after 35 minutes", flush=True)
             success = False
-        
+        except asyncio.CancelledError:
+            # Request dropped while queued: keep the job from running at all
+            job.cancel()
+            raise
+        finally:
+            started_wait.cancel()
+
         processing_time = time.time() - start_time
         
         if success:
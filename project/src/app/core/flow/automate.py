@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
 
+import asyncio
+import functools
+import hashlib
+import logging
+import mimetypes
 import os
+import random
 import re
+import shutil
 import sys
+import tempfile
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from typing import List, Optional
+from weakref import WeakKeyDictionary
 
-from playwright.sync_api import sync_playwright, expect
+from playwright.sync_api import Error as PlaywrightError, expect, sync_playwright
 
 # Add project paths
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -20,26 +32,232 @@ sys.path.append(automation_dir)
 
 # Import settings and login service
 from config.settings import settings  # noqa: E402
-from services.automation.login_process import perform_google_login  # noqa: E402
+from ...services.automation.login_process import perform_google_login  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Filename sanitizing table and pattern, built once
+_INVALID_FILENAME_CHARS = str.maketrans(
+    {**{c: '_' for c in '<>:"/\\|?*'}, **{chr(i): '_' for i in range(32)}}
+)
+_REPEATED_SEPARATORS = re.compile(r'[_\s]+')
+# Anything sanitize_filename would change: invalid or blank characters,
+# doubled underscores, or leading/trailing dots and spaces
+_NEEDS_SANITIZING = re.compile(r'[<>:"/\\|?*\x00-\x1f\s]|__|^[. ]|[. ]$')
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> str:
+    """Create a directory once per process and return its path."""
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write data beside path, then rename it into place so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _copy_file(source: str, path: str) -> None:
+    """Copy source beside path, then rename it into place so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".", suffix=".part")
+    os.close(fd)
+    try:
+        shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+@functools.lru_cache(maxsize=1)
+def _playwright_available() -> bool:
+    """Launch and close a headless Chromium once to prove Playwright works.
+
+    Cached for the process; call ``_playwright_available.cache_clear()`` to re-check.
+    """
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            browser.close()
+        logger.info("Playwright Chromium is available.")
+        return True
+    except Exception as e:
+        logger.error(f"Playwright check failed: {e}")
+        return False
 
 
+@functools.lru_cache(maxsize=1)
 def _default_chrome_profile() -> str:
     """Trả về đường dẫn profile mặc định theo OS."""
     # Use fixed shared profile path for consistency between IIS and console
     if sys.platform.startswith("win"):
         # Use a shared location that both IIS and user can access
         shared_profile = r"C:\playwright-browsers\chrome-profile"
-        os.makedirs(shared_profile, exist_ok=True)
-        return shared_profile
+        return _ensure_dir(shared_profile)
     else:
         # Linux
         home = os.path.expanduser("~")
         return os.path.join(home, ".config", "google-chrome", "Default")
 
 
+# Most profile slots tried before giving up (one per worker process)
+_MAX_PROFILE_SLOTS = 16
+
+# Lock files of claimed profile slots, kept open for the life of the process
+_profile_locks = []
+
+
+def _try_lock(lock_file) -> bool:
+    """Take a non-blocking exclusive lock on an open file."""
+    try:
+        if sys.platform.startswith("win"):
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _worker_chrome_profile() -> str:
+    """Claim a Chrome profile directory that only this process uses.
+
+    Chromium locks a user-data dir while a persistent context is open, and
+    the shared context (see NotebookLMAutomation.get_context) stays open
+    until shutdown, so each worker process needs its own profile. Slot 0 is
+    the default profile; further workers get ``-1``, ``-2``, ... suffixes.
+    The claim is an OS file lock released when the process exits, so slots
+    and their Google sessions are reused across restarts.
+    """
+    base = _default_chrome_profile()
+    _ensure_dir(os.path.dirname(base))
+    for slot in range(_MAX_PROFILE_SLOTS):
+        path = base if slot == 0 else f"{base}-{slot}"
+        lock_file = open(f"{path}.lock", "a+b")
+        if _try_lock(lock_file):
+            _profile_locks.append(lock_file)
+            return path
+        lock_file.close()
+    raise RuntimeError(f"All {_MAX_PROFILE_SLOTS} Chrome profile slots are in use")
+
+
 class NotebookLMAutomation:
     """NotebookLM automation handler for text-to-speech workflow."""
 
+    # Selector fallbacks, tried together through one combined locator
+    CREATE_SELECTORS = (
+        # Aria-label selectors (most reliable)
+        'button[aria-label="Create new notebook"]',
+        'button[aria-label*="Create new"]',
+
+        # Class-based selectors
+        'button.create-new-button',
+        '.create-new-button',
+
+        # Text content selectors
+        'text="Create new"',
+        'text="Tạo mới"',
+
+        # Combined selectors for better accuracy
+        'button:has-text("Create new")',
+
+        # Specific span selector
+        'span.create-new-label',
+        '.create-new-label',
+
+        # Material Design button selectors
+        'button[mat-flat-button]:has-text("Create new")',
+        'button.mat-mdc-unelevated-button:has-text("Create new")',
+
+        # Icon + text combination (native XPath instead of nested :has()),
+        # last resort since it walks every button's descendants
+        'xpath=//button[.//*[@data-mat-icon-type="font"] and contains(translate(normalize-space(), "CREATNW", "creatnw"), "create new")]',
+    )
+
+    COPIED_TEXT_SELECTORS = (
+        'text="Copied text"',
+        'text="Văn bản đã sao chép"',
+        # translate() lowercases the chip text: XPath contains() is case-sensitive
+        'xpath=//mat-chip[contains(translate(normalize-space(), "COPIEDTX", "copiedtx"), "copied text")]',
+        'xpath=//mat-chip[contains(translate(normalize-space(), "VĂNBẢ", "vănbả"), "văn bản")]',
+    )
+
+    INSERT_SELECTORS = (
+        'text="Insert"',
+        'text="Chèn"',
+        'text="Thêm"',
+        'button:has-text("Insert")',
+        'button:has-text("Chèn")',
+        'button:has-text("Thêm")',
+    )
+
+    AUDIO_OVERVIEW_SELECTORS = (
+        'button[aria-label*="Audio Overview"]',
+        'button[aria-label*="Tổng quan âm thanh"]',
+        'button:has-text("Audio Overview")',
+        'button:has-text("Tổng quan âm thanh")',
+        'button:has-text("tổng quan")',
+    )
+
+    DOWNLOAD_MENU_SELECTORS = (
+        '[role="menuitem"][aria-label*="Download"]',
+        '[role="menuitem"][aria-label*="Tải xuống"]',
+        '[role="menuitem"]:has-text("Download")',
+        '[role="menuitem"]:has-text("Tải xuống")',
+    )
+
+    # Locale-agnostic accessible names, matched in one probe for both UI languages
+    AUDIO_OVERVIEW_NAME = re.compile(r"Audio Overview|Tổng quan âm thanh", re.IGNORECASE)
+    DOWNLOAD_NAME = re.compile(r"Download|Tải xuống", re.IGNORECASE)
+
+    # Messages NotebookLM shows when the daily Audio Overview quota is used up
+    LIMIT_MESSAGES = (
+        "You have reached your daily Audio Overview limits",
+        "Bạn đã đạt giới hạn",
+        "đã đạt giới hạn",
+        "giới hạn hàng ngày",
+    )
+    # All of them in one text match, so the check is a single query
+    LIMIT_MESSAGE_PATTERN = re.compile(
+        "|".join(re.escape(message) for message in LIMIT_MESSAGES), re.IGNORECASE
+    )
+
+    # Enabled More button on an artifact means audio generation has finished
+    AUDIO_READY_SELECTOR = "artifact-library-item button[aria-label*='More']:not([disabled])"
+
+    # Reload cadence while waiting for audio, once the first 5 minutes have passed
+    RELOAD_BASE_DELAY = 30.0
+    RELOAD_MAX_DELAY = 120.0
+    RELOAD_JITTER = 0.25
+
+    # Cookies Google sets only for a signed-in session
+    GOOGLE_SESSION_COOKIES = ("SAPISID", "__Secure-1PSID", "__Secure-3PSID")
+    LOGIN_URL_PATTERN = re.compile(r"accounts\.google\.com|signin")
+
+    # Background writer for debug screenshots
+    _debug_writer = ThreadPoolExecutor(max_workers=1)
+
+    # Browser shared across run_automation calls (see get_context)
+    _playwright = None
+    _shared_context = None
+
+    # Every instance drives the shared context, so one run at a time per process
+    _run_lock = threading.Lock()
+
     def __init__(
         self,
         debug_mode: bool = False,
@@ -53,30 +271,42 @@ class NotebookLMAutomation:
         self.email = email or getattr(settings.gmail, "email", None)
         self.password = password or getattr(settings.gmail, "password", None)
         self.auto_login = getattr(settings.notebooklm, "auto_login", False)
+        self.navigation_url = settings.notebooklm.navigation_url
+        self.headless = settings.notebooklm.headless
+
+        self.profile_path = _worker_chrome_profile()
 
-        self.profile_path = _default_chrome_profile()
+        # Combined locators per page, keyed by selector tuple
+        self._locator_cache = WeakKeyDictionary()
+
+        # Audio URLs the page received and not yet fetched, per page (see watch_media_requests)
+        self._media_urls = WeakKeyDictionary()
+
+        # Hash of the content being converted; prefixes the saved audio file
+        self._content_key = None
 
         # Set up static download folder
         self.static_folder = os.path.join(project_dir, "static")
         self.download_folder = os.path.join(self.static_folder, "audio_downloads")
 
         # Create folders if they don't exist
-        os.makedirs(self.download_folder, exist_ok=True)
-
-        # Log credentials status
-        print("🔐 Login credentials loaded:")
-        print(f"   Email: {self.email[:15]}..." if self.email else "   Email: Not set")
-        print(f"   Password: {'*' * 8}" if self.password else "   Password: Not set")
-        print(f"   Auto-login: {self.auto_login}")
-        print(f"   Debug mode: {self.debug_mode}")
-
+        _ensure_dir(self.download_folder)
+
+        # Log credentials status as a single record
+        lines = [
+            "🔐 Login credentials loaded:",
+            f"   Email: {self.email[:15]}..." if self.email else "   Email: Not set",
+            f"   Password: {'*' * 8}" if self.password else "   Password: Not set",
+            f"   Auto-login: {self.auto_login}",
+            f"   Debug mode: {self.debug_mode}",
+        ]
+        logger.info("\n".join(lines))
 
     def perform_reload_and_try_download(self, page, elapsed_time) -> bool:
         """Reload page and try download."""
         try:
-            print("🔄 Reloading page...")
+            logger.info("🔄 Reloading page...")
             page.reload(wait_until="load", timeout=3000)
-            page.wait_for_timeout(2000)
 
             # Activate page
             try:
@@ -87,40 +317,66 @@ class NotebookLMAutomation:
                 except Exception:
                     pass  # Page activation failed, continue anyway
 
+            # Only go for the menu once the reloaded artifact is ready; otherwise
+            # try_download_method would sit in its 60s enable wait every reload
+            if not self.wait_for_audio_ready(page, 10):
+                return False
+
             # Try download using more menu only
             return self.try_download_method(page, "more")
 
         except Exception as e:
-            print(f"❌ Reload error: {e}")
+            logger.error(f"❌ Reload error: {e}")
             return False
 
     def debug_page_state(self, page, step_name: str) -> None:
-        """Debug helper - always print URL and take screenshot."""
+        """Debug helper - print URL and take screenshot when debug mode is on."""
+        if not self.debug_mode:
+            return
+
         try:
-            print(f"🔍 Debug [{step_name}]: {page.url}", flush=True)
-            screenshot_path = f"debug_{step_name}.png"
-            page.screenshot(path=screenshot_path)
-            print(f"   📸 Screenshot saved: {screenshot_path}", flush=True)
+            logger.info(f"🔍 Debug [{step_name}]: {page.url}")
+            screenshot_path = f"debug_{step_name}.jpg"
+            # JPEG of the viewport only; the disk write happens off the automation thread
+            data = page.screenshot(type="jpeg", quality=60, full_page=False)
+            self._debug_writer.submit(_write_bytes, screenshot_path, data)
+            logger.info(f"   📸 Screenshot saved: {screenshot_path}")
         except Exception as e:
-            print(f"⚠️ Debug error [{step_name}]: {e}", flush=True)
+            logger.warning(f"⚠️ Debug error [{step_name}]: {e}")
 
     def handle_google_login(self, page) -> bool:
         """Handle Google login if credentials are provided."""
         if not self.auto_login:
-            print("ℹ️ Auto login disabled - using existing session")
+            logger.info("ℹ️ Auto login disabled - using existing session")
             return True
 
         if not self.email or not self.password:
-            print("ℹ️ No login credentials found in .env - using existing session")
+            logger.info("ℹ️ No login credentials found in .env - using existing session")
             return True
 
         try:
-            print(f"🔐 Attempting Google login with {self.email}...")
+            current_url = page.url.lower()
+            on_login_page = "accounts.google.com" in current_url or "signin" in current_url
+
+            # Session cookies in the profile mean we're signed in - no need to
+            # wait around for a sign-in redirect
+            if not on_login_page and self.has_google_session(page.context):
+                logger.info("ℹ️ Google session cookies found - already logged in")
+                return True
+
+            # No session cookies: give NotebookLM a moment to redirect to sign-in
+            if not on_login_page:
+                try:
+                    page.wait_for_url(self.LOGIN_URL_PATTERN, timeout=5000)
+                except Exception:
+                    pass
+
+            logger.info(f"🔐 Attempting Google login with {self.email}...")
 
             # Check if already logged in by looking for account indicators
             current_url = page.url.lower()
             if "accounts.google.com" not in current_url and "signin" not in current_url:
-                print("ℹ️ Not on login page - may already be logged in")
+                logger.info("ℹ️ Not on login page - may already be logged in")
                 return True
 
             # Perform login
@@ -129,233 +385,177 @@ class NotebookLMAutomation:
             )
 
             if login_success:
-                print("Google login successful")
+                logger.info("Google login successful")
                 # Navigate back to NotebookLM after login
-                page.goto(settings.notebooklm.navigation_url)
-                page.wait_for_timeout(3000)
+                page.goto(self.navigation_url)
             else:
-                print("Google login failed")
+                logger.error("Google login failed")
 
             return login_success
 
         except Exception as e:
-            print(f"Login error: {e}")
+            logger.error(f"Login error: {e}")
+            return False
+
+    def has_google_session(self, context) -> bool:
+        """Check the browser context for Google session cookies."""
+        try:
+            cookies = context.cookies("https://accounts.google.com")
+        except Exception:
+            return False
+        return any(cookie["name"] in self.GOOGLE_SESSION_COOKIES for cookie in cookies)
+
+    def combined_locator(self, page, selectors: tuple):
+        """Build a single locator matching any of the given selectors.
+
+        Plain CSS selectors are joined into one comma-separated selector;
+        ``text=``/``xpath=`` selectors are merged in with ``or_()`` so the
+        whole fallback list resolves in one query instead of one per entry.
+        Matches come back in DOM order, so hidden ones are filtered out before
+        taking the first; otherwise a hidden duplicate would shadow a visible
+        match. Locators are lazy, so the result is cached per page and reused.
+        """
+        page_cache = self._locator_cache.setdefault(page, {})
+        cached = page_cache.get(selectors)
+        if cached is not None:
+            return cached
+
+        css = [s for s in selectors if not s.startswith(("text=", "xpath="))]
+        others = [s for s in selectors if s.startswith(("text=", "xpath="))]
+
+        locator = page.locator(", ".join(css)) if css else None
+        for selector in others:
+            other = page.locator(selector)
+            locator = other if locator is None else locator.or_(other)
+
+        page_cache[selectors] = locator.filter(visible=True).first
+        return page_cache[selectors]
+
+    def find_labelled(self, page, selectors: tuple, role: str, name, timeout: int = 3000, scope=None):
+        """Wait for an element matching the CSS fallbacks or its ARIA role + name.
+
+        Both lookups are raced in one waiter instead of timing out one after
+        another. Only visible matches count, so a hidden duplicate earlier in
+        the DOM can't win. ``scope`` narrows the role lookup to a subtree.
+        Returns the locator, or None if nothing shows up within ``timeout``.
+        """
+        root = page if scope is None else scope
+        target = (
+            self.combined_locator(page, selectors)
+            .or_(root.get_by_role(role, name=name))
+            .filter(visible=True)
+            .first
+        )
+        try:
+            expect(target).to_be_visible(timeout=timeout)
+            return target
+        except Exception as e:
+            logger.info(f"   Lookup failed: {e}")
+            return None
+
+    def click_first_match(self, page, selectors: tuple, timeout: int = 10000) -> bool:
+        """Wait for any selector to match, then click it; return False if none shows up."""
+        try:
+            target = self.combined_locator(page, selectors)
+            target.wait_for(state="visible", timeout=timeout)
+            target.click()
+            return True
+        except Exception:
             return False
 
     def get_content(self, content_source: str) -> Optional[str]:
         """Get content from either direct text or file (hiện dùng direct text)."""
-        print("📤 Processing content source...")
+        logger.info("📤 Processing content source...")
 
-        if isinstance(content_source, str) and len(content_source.strip()) > 10:
-            print(f"Using direct text content ({len(content_source)} chars)")
-            return content_source.strip()
+        # Strip once and reuse; content can be a long script
+        stripped = content_source.strip() if isinstance(content_source, str) else ""
+        if len(stripped) > 10:
+            logger.info(f"Using direct text content ({len(content_source)} chars)")
+            return stripped
 
-        print(f"Invalid content source (too short or not text): {content_source}")
-        print("💡 Content must be at least 10 characters long")
+        logger.error(f"Invalid content source (too short or not text): {content_source}")
+        logger.info("💡 Content must be at least 10 characters long")
         return None
 
     def upload_content_to_notebooklm(self, page, content: str) -> bool:
         """Upload content to NotebookLM."""
         try:
             # Navigate to NotebookLM
-            print("🌐 Navigating to NotebookLM...")
-            page.goto(settings.notebooklm.navigation_url)
-            page.wait_for_timeout(3000)
+            logger.info("🌐 Navigating to NotebookLM...")
+            page.goto(self.navigation_url)
 
             # Handle login if needed
             if not self.handle_google_login(page):
-                print("Login failed - cannot proceed")
+                logger.error("Login failed - cannot proceed")
                 return False
 
-            page.wait_for_timeout(2000)
-
             # Create new
-            print("📋 Creating new...")
-            # Try multiple selectors based on actual HTML structure
-            create_selectors = [
-                # Aria-label selectors (most reliable)
-                'button[aria-label="Create new notebook"]',
-                'button[aria-label*="Create new"]',
-                
-                # Class-based selectors
-                'button.create-new-button',
-                '.create-new-button',
-                
-                # Text content selectors
-                'text="Create new"',
-                'text="Tạo mới"',
-                
-                # Combined selectors for better accuracy
-                'button:has-text("Create new")',
-                'button mat-icon[data-mat-icon-type="font"]:has-text("add") ~ .mdc-button__label',
-                
-                # Specific span selector
-                'span.create-new-label',
-                '.create-new-label',
-                
-                # Material Design button selectors
-                'button[mat-flat-button]:has-text("Create new")',
-                'button.mat-mdc-unelevated-button:has-text("Create new")',
-                
-                # Icon + text combination
-                'button:has(mat-icon):has-text("Create new")',
-                'button:has([data-mat-icon-type="font"]):has-text("Create new")',
-                
-                # Fallback xpath
-                'xpath=/html/body/labs-tailwind-root/div/welcome-page/div/div[1]/div/div[2]/div/div/button/span[2]/span'
-            ]
-
-            create_clicked = False
-            for selector in create_selectors:
-                try:
-                    btn = page.locator(selector).first
-                    if btn.count() > 0:
-                        btn.click()
-                        create_clicked = True
-                        print(f"Clicked create button with: {selector}")
-                        break
-                except:
-                    continue
-
-            if not create_clicked:
-                print("❌ Could not find Create new button")
+            logger.info("📋 Creating new...")
+            create_clicked = self.click_first_match(page, self.CREATE_SELECTORS)
+            if create_clicked:
+                logger.info("Clicked create button")
+            else:
+                logger.error("❌ Could not find Create new button")
                 self.debug_page_state(page, "01_no_create_button")
                 return False
 
-            page.wait_for_timeout(2000)
             self.debug_page_state(page, "02_after_create_click")
 
             # Click "Copied text"
-            print("📎 Adding copied text...")
-            copied_selectors = [
-                'text="Copied text"',
-                'text="Văn bản đã sao chép"',
-                'mat-chip:has-text("Copied text")',
-                'mat-chip:has-text("Văn bản")',
-                'mat-chip:has-text("văn bản")'
-            ]
-
-            copied_clicked = False
-            for selector in copied_selectors:
-                try:
-                    chip = page.locator(selector).first
-                    if chip.count() > 0:
-                        chip.click()
-                        copied_clicked = True
-                        print(f"Clicked copied text with: {selector}")
-                        break
-                except:
-                    continue
-
-            if not copied_clicked:
-                print("❌ Could not find Copied text chip")
+            logger.info("📎 Adding copied text...")
+            copied_clicked = self.click_first_match(page, self.COPIED_TEXT_SELECTORS)
+            if copied_clicked:
+                logger.info("Clicked copied text")
+            else:
+                logger.error("❌ Could not find Copied text chip")
                 self.debug_page_state(page, "03_no_copied_text")
                 return False
 
-            page.wait_for_timeout(2000)
             self.debug_page_state(page, "04_after_copied_text_click")
 
             # Paste content
-            print(f"✍️ Pasting {len(content)} chars...")
+            logger.info(f"✍️ Pasting {len(content)} chars...")
             dialog = page.get_by_role("dialog").first
             dialog.locator("textarea").first.fill(content)
 
             # Insert
-            insert_selectors = [
-                'text="Insert"',
-                'text="Chèn"',
-                'text="Thêm"',
-                'button:has-text("Insert")',
-                'button:has-text("Chèn")',
-                'button:has-text("Thêm")'
-            ]
-
-            insert_clicked = False
-            for selector in insert_selectors:
-                try:
-                    btn = page.locator(selector).first
-                    if btn.count() > 0:
-                        btn.click()
-                        insert_clicked = True
-                        print(f"Clicked insert with: {selector}")
-                        break
-                except:
-                    continue
-
-            if not insert_clicked:
-                print("❌ Could not find Insert button")
+            insert_clicked = self.click_first_match(page, self.INSERT_SELECTORS)
+            if insert_clicked:
+                logger.info("Clicked insert")
+            else:
+                logger.error("❌ Could not find Insert button")
                 self.debug_page_state(page, "05_no_insert_button")
                 return False
-            
-            page.wait_for_timeout(1500)
+
+            # Wait for the paste dialog to close instead of a fixed delay
+            try:
+                dialog.wait_for(state="hidden", timeout=10000)
+            except Exception:
+                pass
             self.debug_page_state(page, "06_after_insert_click")
-            print("✅ Content uploaded successfully!")
+            logger.info("✅ Content uploaded successfully!")
             return True
 
         except Exception as e:
-            print(f"Upload error: {e}")
+            logger.error(f"Upload error: {e}")
             self.debug_page_state(page, "upload_error")
             return False
 
     def generate_audio_overview(self, page) -> bool:
         """Generate audio overview in NotebookLM."""
         try:
-            print("🎵 Generating Audio Overview...", flush=True)
-            print("🔍 Looking for Audio Overview button...", flush=True)
+            logger.info("🎵 Generating Audio Overview...")
+            logger.info("🔍 Looking for Audio Overview button...")
             self.debug_page_state(page, "07_before_audio_overview")
 
-            # Look for Audio Overview button using best practices
-            audio_overview_btn = None
-
-            # Method 1: get_by_role for buttons
-            try:
-                audio_overview_btn = page.get_by_role("button", name="Audio Overview")
-                expect(audio_overview_btn).to_be_visible(timeout=3000)
-                print("Found Audio Overview with get_by_role")
-            except Exception:
-                try:
-                    audio_overview_btn = page.get_by_role("button", name="Tổng quan âm thanh")
-                    expect(audio_overview_btn).to_be_visible(timeout=3000)
-                    print("Found Audio Overview with get_by_role (Vietnamese)")
-                except Exception as e:
-                    print(f"   get_by_role failed: {e}")
-                    audio_overview_btn = None
-
-            # Method 2: get_by_text
-            if not audio_overview_btn:
-                try:
-                    audio_overview_btn = page.get_by_text("Audio Overview", exact=False)
-                    expect(audio_overview_btn).to_be_visible(timeout=3000)
-                    print("Found Audio Overview with get_by_text")
-                except Exception:
-                    try:
-                        audio_overview_btn = page.get_by_text("Tổng quan âm thanh", exact=False)
-                        expect(audio_overview_btn).to_be_visible(timeout=3000)
-                        print("Found Audio Overview with get_by_text (Vietnamese)")
-                    except Exception as e:
-                        print(f"   get_by_text failed: {e}")
-                        audio_overview_btn = None
-
-            # Method 3: Fallback with locators
-            if not audio_overview_btn:
-                selectors = [
-                    'button:has-text("Audio Overview")',
-                    'button:has-text("Tổng quan âm thanh")',
-                    'button:has-text("tổng quan")'
-                ]
-                for selector in selectors:
-                    try:
-                        audio_overview_btn = page.locator(selector).first
-                        expect(audio_overview_btn).to_be_visible(timeout=2000)
-                        print(f"Found Audio Overview with: {selector}")
-                        break
-                    except Exception:
-                        continue
-                else:
-                    audio_overview_btn = None
-
-            if not audio_overview_btn:
-                print("❌ Audio Overview button not found")
+            # Look for Audio Overview button
+            audio_overview_btn = self.find_labelled(
+                page, self.AUDIO_OVERVIEW_SELECTORS, "button", self.AUDIO_OVERVIEW_NAME
+            )
+            if audio_overview_btn:
+                logger.info("Found Audio Overview button")
+            else:
+                logger.error("❌ Audio Overview button not found")
                 self.debug_page_state(page, "08_no_audio_overview_button")
                 return False
 
@@ -363,130 +563,92 @@ class NotebookLMAutomation:
             try:
                 expect(audio_overview_btn).to_be_enabled(timeout=3000)
                 audio_overview_btn.click()
-                print("✅ Audio Overview clicked successfully", flush=True)
+                logger.info("✅ Audio Overview clicked successfully")
             except Exception as e:
-                print(f"❌ Failed to click Audio Overview: {e}", flush=True)
+                logger.error(f"❌ Failed to click Audio Overview: {e}")
                 self.debug_page_state(page, "09_failed_to_click_audio_overview")
                 return False
 
-            # Wait for UI to respond
-            print("⏳ Waiting for audio generation to start...", flush=True)
-            page.wait_for_timeout(3000)
+            # Wait for UI to respond: either the new artifact or a daily-limit
+            # message, whichever shows first. Hidden matches (e.g. i18n template
+            # text) are filtered out so they can't stand in for a visible banner
+            logger.info("⏳ Waiting for audio generation to start...")
+            limit_message = page.get_by_text(self.LIMIT_MESSAGE_PATTERN).filter(visible=True)
+            try:
+                (
+                    page.locator("artifact-library-item")
+                    .or_(limit_message)
+                    .filter(visible=True)
+                    .first.wait_for(state="visible", timeout=10000)
+                )
+            except Exception:
+                pass  # Limit message check below still applies
 
+            # Check for daily limits right away, while a transient toast is still
+            # up; the debug snapshot comes after so it can't delay the check
+            limit_reached = limit_message.count() > 0
             self.debug_page_state(page, "10_after_audio_overview_click")
+            if limit_reached:
+                logger.error("❌ Daily limits reached!")
+                return False
 
-            # Check for daily limits using best practices
-            limit_messages = [
-                "You have reached your daily Audio Overview limits",
-                "Bạn đã đạt giới hạn",
-                "đã đạt giới hạn",
-                "giới hạn hàng ngày"
-            ]
-
-            for message in limit_messages:
-                try:
-                    limit_text = page.get_by_text(message, exact=False)
-                    expect(limit_text).to_be_visible(timeout=1000)
-                    print("❌ Daily limits reached!")
-                    return False
-                except Exception:
-                    continue
-
-            print("✅ Audio generation initiated")
+            logger.info("✅ Audio generation initiated")
             return True
 
         except Exception as e:
-            print(f"❌ Audio generation error: {e}")
+            logger.error(f"❌ Audio generation error: {e}")
             return False
 
     def wait_for_audio_completion(self, page, max_wait_minutes: int = 15) -> bool:
-        """Simplified wait with reload + download retry."""
-        print(f"⏳ Waiting for audio (max {max_wait_minutes} min)...")
-
-        max_wait_time = max_wait_minutes * 60
-        elapsed_time = 0
-        last_reload = 0
-        last_download = 0
-
-        while elapsed_time < max_wait_time:
-            # Auto-reload every 30 seconds ONLY after 5 minutes (300 seconds)
-            if elapsed_time >= 300 and elapsed_time - last_reload >= 30:
-                if self.perform_reload_and_try_download(page, elapsed_time):
-                    return True
-                last_reload = elapsed_time
-
-            # Check if generating using better approach
-            is_generating = False
-            generating_messages = [
-                "Generating",
-                "Đang tạo",
-                "Đang xử lý",
-                "Processing"
-            ]
+        """Wait for the audio artifact, then reload + download retry."""
+        logger.info(f"⏳ Waiting for audio (max {max_wait_minutes} min)...")
 
-            for message in generating_messages:
-                try:
-                    generating_text = page.get_by_text(message, exact=False)
-                    expect(generating_text).to_be_visible(timeout=100)
-                    is_generating = True
-                    break
-                except Exception:
-                    continue
+        start_time = time.monotonic()
+        deadline = start_time + max_wait_minutes * 60
 
-            if is_generating:
-                print(f"   🔄 Still generating... ({elapsed_time//60}:{elapsed_time%60:02d})")
-            else:
-                # Check if audio ready using better approach
-                audio_found = False
-
-                # Check for duration indicators
-                duration_indicators = ["phút", "minute", "min"]
-                for indicator in duration_indicators:
-                    try:
-                        duration_text = page.get_by_text(indicator, exact=False)
-                        expect(duration_text).to_be_visible(timeout=100)
-                        audio_found = True
-                        break
-                    except Exception:
-                        continue
-
-                # Check for More button as audio ready indicator
-                if not audio_found:
-                    try:
-                        more_btn = page.get_by_text("More", exact=False)
-                        expect(more_btn).to_be_visible(timeout=100)
-                        audio_found = True
-                    except Exception:
-                        try:
-                            more_btn = page.get_by_text("Thêm", exact=False)
-                            expect(more_btn).to_be_visible(timeout=100)
-                            audio_found = True
-                        except Exception:
-                            pass
-
-                # Check for artifact elements
-                if not audio_found:
-                    try:
-                        artifact = page.locator("artifact-library-item").first
-                        expect(artifact).to_be_visible(timeout=100)
-                        audio_found = True
-                    except Exception:
-                        pass
-
-                # Try download when audio ready and after minimum wait time
-                if audio_found and elapsed_time >= 180:  # Wait at least 3 minutes
-                    if self.try_download_method(page, "more"):
-                        return True
-                    # If download failed, wait longer before next attempt
-                    page.wait_for_timeout(60000)  # Wait 60 more seconds
-                    elapsed_time += 60
-
-            page.wait_for_timeout(3000)  # 30 sec intervals
-            elapsed_time += 30
-
-        print(f"❌ Timeout after {max_wait_minutes} minutes")
+        # Let the browser watch the DOM for the ready artifact instead of
+        # probing from Python; reloads only start after 5 minutes (300 seconds)
+        first_reload = min(start_time + 300, deadline)
+        if self.wait_for_audio_ready(page, first_reload - time.monotonic()):
+            if self.try_download_method(page, "more"):
+                return True
+
+        attempt = 0
+        while time.monotonic() < deadline:
+            elapsed_time = int(time.monotonic() - start_time)
+            logger.info(f"   🔄 Still generating... ({elapsed_time//60}:{elapsed_time%60:02d})")
+            if self.perform_reload_and_try_download(page, elapsed_time):
+                return True
+
+            # Reload again after a backed-off, jittered interval (30s, 60s, then
+            # every ~2 min) unless the artifact shows up sooner
+            interval = self.reload_interval(attempt)
+            attempt += 1
+            remaining = deadline - time.monotonic()
+            if remaining > 0 and self.wait_for_audio_ready(page, min(interval, remaining)):
+                if self.try_download_method(page, "more"):
+                    return True
+
+        logger.error(f"❌ Timeout after {max_wait_minutes} minutes")
         return False
 
+    def reload_interval(self, attempt: int) -> float:
+        """Seconds to wait before the next reload: exponential backoff with jitter."""
+        delay = min(self.RELOAD_MAX_DELAY, self.RELOAD_BASE_DELAY * (2 ** attempt))
+        return delay * (1 + random.uniform(-self.RELOAD_JITTER, self.RELOAD_JITTER))
+
+    def wait_for_audio_ready(self, page, timeout_seconds: float) -> bool:
+        """Wait until the generated audio's More button is enabled."""
+        if timeout_seconds <= 0:
+            return False
+        try:
+            page.wait_for_selector(
+                self.AUDIO_READY_SELECTOR, state="visible", timeout=timeout_seconds * 1000
+            )
+            return True
+        except Exception:
+            return False
+
     def find_element_with_expect(self, page, selectors: list, description: str):
         """Find element using Playwright best practices with expect()."""
         for selector in selectors:
@@ -495,90 +657,58 @@ class NotebookLMAutomation:
                 expect(candidate).to_be_visible(timeout=3000)
                 return candidate
             except Exception as e:
-                print(f"   Failed selector {selector}: {e}")
+                logger.info(f"   Failed selector {selector}: {e}")
                 continue
-        print(f"❌ Could not find {description}")
+        logger.error(f"❌ Could not find {description}")
         return None
 
     def try_download_method(self, page, method: str) -> bool:
         """Try More menu download method."""
-        page.wait_for_timeout(5000)
+        # Skip the menu round-trip when the audio URL is already known
+        if self.download_captured_audio(page):
+            return True
 
-        print("📋 Trying More menu...")
+        logger.info("📋 Trying More menu...")
 
         # Use the working XPath that was found
         try:
             more_btn = page.locator("//artifact-library-item//button[contains(@aria-label, 'More')]")
             expect(more_btn).to_be_visible(timeout=15000)
-            print("✅ Found More button")
+            logger.info("✅ Found More button")
         except Exception as e:
-            print(f"❌ Could not find More button: {e}")
+            logger.error(f"❌ Could not find More button: {e}")
             return False
 
         # Wait for More button to be enabled (audio generation complete)
-        print("   Waiting for More button to be enabled...")
+        logger.info("   Waiting for More button to be enabled...")
         try:
             expect(more_btn).to_be_enabled(timeout=60000)  # Wait up to 60 seconds
             more_btn.click()
-            print("✅ More button clicked")
+            logger.info("✅ More button clicked")
         except Exception as e:
-            print(f"❌ More button not enabled within timeout: {e}")
+            logger.error(f"❌ More button not enabled within timeout: {e}")
             return False
 
-        page.wait_for_timeout(3000)
-
-        # Find download menu item using best practices
-        print("   Looking for Download menu item...")
-        dl_btn = None
-
-        # Method 1: get_by_role for menu items
+        # Wait for the menu to open instead of a fixed delay
         try:
-            dl_btn = page.get_by_role("menuitem", name="Download")
-            expect(dl_btn).to_be_visible(timeout=3000)
-            print("✅ Found Download with get_by_role")
+            page.locator('[role="menuitem"]').first.wait_for(state="visible", timeout=5000)
         except Exception:
-            try:
-                dl_btn = page.get_by_role("menuitem", name="Tải xuống")
-                expect(dl_btn).to_be_visible(timeout=3000)
-                print("✅ Found Download with get_by_role (Vietnamese)")
-            except Exception as e:
-                print(f"   get_by_role for menuitem failed: {e}")
-                dl_btn = None
-
-        # Method 2: get_by_text for download text
-        if not dl_btn:
-            try:
-                dl_btn = page.get_by_text("Download", exact=False)
-                expect(dl_btn).to_be_visible(timeout=3000)
-                print("✅ Found Download with get_by_text")
-            except Exception:
-                try:
-                    dl_btn = page.get_by_text("Tải xuống", exact=False)
-                    expect(dl_btn).to_be_visible(timeout=3000)
-                    print("✅ Found Download with get_by_text (Vietnamese)")
-                except Exception as e:
-                    print(f"   get_by_text failed: {e}")
-                    dl_btn = None
-
-        # Method 3: Fallback with locators
-        if not dl_btn:
-            selectors = [
-                '[role="menuitem"]:has-text("Download")',
-                '[role="menuitem"]:has-text("Tải xuống")'
-            ]
-            for selector in selectors:
-                try:
-                    dl_btn = page.locator(selector).first
-                    expect(dl_btn).to_be_visible(timeout=2000)
-                    print(f"✅ Found Download with: {selector}")
-                    break
-                except Exception:
-                    continue
-            else:
-                dl_btn = None
-
-        if not dl_btn:
-            print("❌ Could not find Download menu item")
+            pass  # Fallback lookups below report the failure
+
+        # Find download menu item; the role fallback only searches the
+        # open menu, not the whole page
+        logger.info("   Looking for Download menu item...")
+        dl_btn = self.find_labelled(
+            page,
+            self.DOWNLOAD_MENU_SELECTORS,
+            "menuitem",
+            self.DOWNLOAD_NAME,
+            scope=page.locator('[role="menu"]'),
+        )
+        if dl_btn:
+            logger.info("✅ Found Download menu item")
+        else:
+            logger.error("❌ Could not find Download menu item")
             return False
 
         # Execute download using best practices
@@ -586,39 +716,113 @@ class NotebookLMAutomation:
             expect(dl_btn).to_be_enabled(timeout=3000)
             with page.expect_download(timeout=3000) as dl_info:
                 dl_btn.click()
-                print("✅ Download button clicked")
+                logger.info("✅ Download button clicked")
 
             download = dl_info.value
             suggested_filename = download.suggested_filename
-            
-            # Sanitize filename to prevent truncation and invalid characters
-            safe_filename = self.sanitize_filename(suggested_filename)
-            print(f"✅ Download started: {suggested_filename}")
-            if safe_filename != suggested_filename:
-                print(f"   Sanitized to: {safe_filename}")
 
-            # Wait for download to complete and save to our folder
+            # Sanitize filename to prevent truncation and invalid characters
+            prefixed_filename = self.audio_filename(suggested_filename)
+            safe_filename = self.sanitize_filename(prefixed_filename)
+            logger.info(f"✅ Download started: {suggested_filename}")
+            if safe_filename != prefixed_filename:
+                logger.info(f"   Sanitized to: {safe_filename}")
+
+            # Wait for download to complete, then move it into our folder.
+            # Downloads land in download_folder already, so this is a rename
             download_path = os.path.join(self.download_folder, safe_filename)
-            download.save_as(download_path)
-            print(f"✅ Download saved to: {download_path}")
+            source_path = download.path()
+            try:
+                os.replace(source_path, download_path)
+            except OSError:
+                _copy_file(source_path, download_path)
+                os.remove(source_path)
+            logger.info(f"✅ Download saved to: {download_path}")
 
             return True
         except Exception as e:
-            print(f"❌ Download failed: {e}")
+            logger.error(f"❌ Download failed: {e}")
             return False
-    
+
+    def watch_media_requests(self, page) -> None:
+        """Record the URLs of audio responses the page receives.
+
+        Only media responses served as ``audio/*`` are kept, each URL once,
+        so download_captured_audio never has to probe unrelated media.
+        """
+        pending = self._media_urls.setdefault(page, [])
+        seen = set()
+
+        def on_response(response) -> None:
+            url = response.url
+            if url in seen or not url.startswith("http"):
+                return
+            if response.request.resource_type != "media" or not response.ok:
+                return
+            content_type = response.headers.get("content-type", "").split(";")[0]
+            if content_type.startswith("audio/"):
+                seen.add(url)
+                pending.append((url, content_type))
+
+        page.on("response", on_response)
+
+    def download_captured_audio(self, page) -> bool:
+        """Fetch a captured audio URL straight to disk through the context's session.
+
+        Each URL is fetched at most once; a failed fetch is not retried on
+        later download attempts.
+        """
+        pending = self._media_urls.get(page, [])
+        while pending:
+            url, content_type = pending.pop()
+            try:
+                response = page.context.request.get(url)
+                if not response.ok:
+                    continue
+
+                ext = mimetypes.guess_extension(content_type) or ".wav"
+                download_path = os.path.join(
+                    self.download_folder,
+                    self.audio_filename(f"notebooklm_audio_{time.time_ns()}{ext}"),
+                )
+                _write_bytes(download_path, response.body())
+                logger.info(f"✅ Audio fetched directly to: {download_path}")
+                return True
+            except Exception as e:
+                logger.info(f"   Direct audio fetch failed: {e}")
+        return False
+
+    def audio_filename(self, filename: str) -> str:
+        """Prefix a downloaded file name with the current content hash."""
+        if not self._content_key:
+            return filename
+        return f"{self._content_key}_{filename}"
+
+    def find_cached_audio(self, content_key: str) -> Optional[str]:
+        """Return the audio previously downloaded for this content hash, if any."""
+        prefix = f"{content_key}_"
+        with os.scandir(self.download_folder) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.is_file():
+                    return entry.path
+        return None
+
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename to remove invalid characters and prevent truncation."""
         if not filename:
             return f"audio_{int(time.time())}.wav"
-        
+
+        # Already clean (the usual case for NotebookLM names): nothing to rewrite
+        if len(filename) <= 255 and not _NEEDS_SANITIZING.search(filename):
+            return filename
+
         # Remove or replace invalid characters for Windows/Linux
         # Keep only alphanumeric, spaces, hyphens, underscores, and dots
-        sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
-        
+        sanitized = filename.translate(_INVALID_FILENAME_CHARS)
+
         # Replace multiple spaces/underscores with single one
-        sanitized = re.sub(r'[_\s]+', '_', sanitized)
-        
+        sanitized = _REPEATED_SEPARATORS.sub('_', sanitized)
+
         # Ensure filename isn't too long (max 255 chars for most filesystems)
         # Keep extension
         name, ext = os.path.splitext(sanitized)
@@ -626,159 +830,227 @@ class NotebookLMAutomation:
             max_name_len = 255 - len(ext) - 10  # Reserve space for extension and safety
             name = name[:max_name_len]
             sanitized = name + ext
-        
+
         # Remove leading/trailing dots and spaces
         sanitized = sanitized.strip('. ')
-        
+
         # If empty after sanitization, use timestamp
         if not sanitized or sanitized == ext:
             sanitized = f"audio_{int(time.time())}{ext if ext else '.wav'}"
-        
+
         return sanitized
 
     def download_audio(self, page) -> bool:
         """Simplified download with dual strategy."""
-        page.wait_for_timeout(3000)
-
         # Only try More menu method
         return self.try_download_method(page, "more")
 
+    @classmethod
+    def get_context(cls, profile_path: str, download_folder: str, headless: bool):
+        """Return the shared persistent browser context, launching it on first use.
+
+        Sync Playwright objects are bound to the thread that started them, so
+        callers must run every automation from the same worker thread.
+        """
+        if cls._shared_context is not None:
+            return cls._shared_context
+
+        # Ensure both profile and download folders exist
+        _ensure_dir(profile_path)
+        _ensure_dir(download_folder)
+
+        playwright = cls._playwright or sync_playwright().start()
+        try:
+            # Use persistent context to keep login state
+            # downloads_path + --download-default-directory ensures correct download location
+            context = playwright.chromium.launch_persistent_context(
+                user_data_dir=profile_path,
+                headless=headless,
+                downloads_path=download_folder,
+                args=[
+                    f"--download-default-directory={download_folder}",
+                    "--disable-blink-features=AutomationControlled",
+                    "--disable-infobars",
+                    "--disable-extensions",
+                    "--no-sandbox",
+                    "--disable-dev-shm-usage",
+                    # Skip images without a context route; any route turns off the HTTP cache
+                    "--blink-settings=imagesEnabled=false",
+                    "--disable-prompt-on-repost",
+                    "--disable-background-downloads",
+                    "--disable-backgrounding-occluded-windows",
+                    "--disable-background-networking",
+                    "--disable-features=TranslateUI",
+                    # No compositing work to accelerate without a window
+                    *(["--disable-gpu"] if headless else []),
+                ],
+            )
+        except Exception:
+            if cls._playwright is None:
+                playwright.stop()
+            raise
+
+        # Drop the cached context if the browser is closed or crashes
+        context.on("close", lambda _: cls._forget_context())
+
+        cls._playwright = playwright
+        cls._shared_context = context
+        return context
+
+    @classmethod
+    def _forget_context(cls) -> None:
+        cls._shared_context = None
+
+    @classmethod
+    def close_context(cls) -> None:
+        """Close the shared browser context and stop Playwright."""
+        context, playwright = cls._shared_context, cls._playwright
+        cls._shared_context = None
+        cls._playwright = None
+        if context is not None:
+            with suppress(Exception):
+                context.close()
+        if playwright is not None:
+            with suppress(Exception):
+                playwright.stop()
+
     def check_playwright_installation(self) -> bool:
         """Check if Playwright is properly installed by launching a temp browser."""
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                browser.close()
-            print("Playwright Chromium is available.")
-            return True
-        except Exception as e:
-            print(f"Playwright check failed: {e}")
-            return False
+        available = _playwright_available()
+        if not available:
+            # Re-check next time in case browsers get installed meanwhile
+            _playwright_available.cache_clear()
+        return available
 
     def run_automation(self, content_source: str, max_wait_minutes: int = 10) -> bool:
         """Run complete NotebookLM automation workflow."""
+        with self._run_lock:
+            return self._run_workflow(content_source, max_wait_minutes)
+
+    def _run_workflow(self, content_source: str, max_wait_minutes: int) -> bool:
+        page = None
         try:
-            print("Starting NotebookLM Text-to-Speech Automation")
-            print("=" * 60)
-
-            # Check Playwright installation first
-            if not self.check_playwright_installation():
-                print("Please install Playwright browsers:")
-                print("   pip install playwright")
-                print("   playwright install chromium")
-                return False
+            logger.info("Starting NotebookLM Text-to-Speech Automation")
+            logger.info("=" * 60)
 
             # Get content
             content = self.get_content(content_source)
             if not content:
                 return False
 
-            print(f"Content preview: {content[:100]}...")
-            print(f"Using Chrome profile: {self.profile_path}")
+            # Identical text was already turned into audio - skip the browser entirely
+            self._content_key = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+            cached_audio = self.find_cached_audio(self._content_key)
+            if cached_audio:
+                logger.info(f"♻️ Audio for this content already exists: {cached_audio}")
+                return True
+
+            # Check Playwright installation (a live shared browser proves it)
+            if self._shared_context is None and not self.check_playwright_installation():
+                logger.info("Please install Playwright browsers:")
+                logger.info("   pip install playwright")
+                logger.info("   playwright install chromium")
+                return False
+
+            logger.info(f"Content preview: {content[:100]}...")
+            logger.info(f"Using Chrome profile: {self.profile_path}")
 
             # Show login status
             if self.auto_login and self.email:
-                print(f"🔐 Auto-login enabled with: {self.email[:15]}...")
+                logger.info(f"🔐 Auto-login enabled with: {self.email[:15]}...")
             else:
-                print("🔐 Using existing browser session (no auto-login)")
+                logger.info("🔐 Using existing browser session (no auto-login)")
 
-            # Launch browser
-            try:
-                print("Launching browser...")
-                print(f"Download folder: {self.download_folder}")
-
-                # Ensure both profile and download folders exist
-                os.makedirs(self.profile_path, exist_ok=True)
-                os.makedirs(self.download_folder, exist_ok=True)
-
-                with sync_playwright() as p:
-                    # Use persistent context to keep login state
-                    # downloads_path + --download-default-directory ensures correct download location
-                    browser = p.chromium.launch_persistent_context(
-                        user_data_dir=self.profile_path,
-                        headless=settings.notebooklm.headless,
-                        downloads_path=self.download_folder,
-                        args=[
-                            f"--download-default-directory={self.download_folder}",
-                            "--disable-blink-features=AutomationControlled",
-                            "--disable-infobars",
-                            "--disable-extensions",
-                            "--no-sandbox",
-                            "--disable-dev-shm-usage",
-                            "--disable-web-security",
-                            "--disable-features=VizDisplayCompositor",
-                            "--disable-prompt-on-repost",
-                            "--disable-background-downloads",
-                            "--disable-backgrounding-occluded-windows"
-                        ],
-                    )
-
-                    print("Browser launched successfully")
-                    page = browser.new_page()
-
-                    try:
-                        # Upload content
-                        if not self.upload_content_to_notebooklm(page, content):
-                            return False
-
-                        # Generate audio
-                        if not self.generate_audio_overview(page):
-                            return False
-
-                        # Wait for completion and download
-                        download_success = self.wait_for_audio_completion(
-                            page, max_wait_minutes
-                        )
-
-                        # If wait_for_audio_completion didn't succeed, try download one more time
-                        if not download_success:
-                            print("🔄 Final download attempt...")
-                            download_success = self.download_audio(page)
-
-                        # Summary
-                        print("\n🎉 Automation Workflow Completed!")
-                        print("📊 Summary:")
-                        print("   Content source: custom text")
-                        print(f"   Content length: {len(content)} chars")
-                        print("   Upload: SUCCESS")
-                        print("   Audio generation: SUCCESS")
-                        print(
-                            f"   Download: {'SUCCESS' if download_success else 'FAILED'}"
-                        )
-
-                        print("\nBrowser staying open for manual check...")
-                        print(f"Audio files saved to: {self.download_folder}")
-                        page.wait_for_timeout(3000)
-
-                        return True
-
-                    except Exception as e:
-                        print(f"Automation error: {e}")
-                        print(f"Error details: {type(e).__name__}: {str(e)}")
-                        self.debug_page_state(page, "error_state")
-                        return False
-
-                    finally:
-                        try:
-                            browser.close()
-                        except Exception:
-                            pass
-
-            except Exception as browser_error:
-                print(f"Browser launch error: {browser_error}")
-                print(f"Error type: {type(browser_error).__name__}")
-                print("Possible solutions:")
-                print("   1. Install Playwright browsers: playwright install chromium")
-                print("   2. Check Chrome installation")
-                print("   3. Run as administrator")
+            # Launch browser (or reuse the one left open by a previous run)
+            logger.info("Launching browser...")
+            logger.info(f"Download folder: {self.download_folder}")
+
+            context = self.get_context(
+                self.profile_path, self.download_folder, self.headless
+            )
+            logger.info("Browser launched successfully")
+            page = context.new_page()
+            self.watch_media_requests(page)
+
+            # Upload content
+            if not self.upload_content_to_notebooklm(page, content):
                 return False
 
+            # Generate audio
+            if not self.generate_audio_overview(page):
+                return False
+
+            # Wait for completion and download
+            download_success = self.wait_for_audio_completion(page, max_wait_minutes)
+
+            # If wait_for_audio_completion didn't succeed, try download one more time
+            if not download_success:
+                logger.info("🔄 Final download attempt...")
+                download_success = self.download_audio(page)
+
+            # Summary
+            lines = [
+                "\n🎉 Automation Workflow Completed!",
+                "📊 Summary:",
+                "   Content source: custom text",
+                f"   Content length: {len(content)} chars",
+                "   Upload: SUCCESS",
+                "   Audio generation: SUCCESS",
+                f"   Download: {'SUCCESS' if download_success else 'FAILED'}",
+                f"Audio files saved to: {self.download_folder}",
+            ]
+            logger.info("\n".join(lines))
+
+            # Leave the page up briefly for manual inspection when debugging
+            if self.debug_mode:
+                logger.info("Browser staying open for manual check...")
+                page.wait_for_timeout(3000)
+
+            return True
+
         except Exception as e:
-            print(f"Critical error: {e}")
-            print(f"Error type: {type(e).__name__}")
-            print("Error location: Content processing or setup")
+            # One handler; where the run stopped tells the failures apart
+            if page is not None:
+                logger.exception("Automation error")
+                self.debug_page_state(page, "error_state")
+            elif isinstance(e, PlaywrightError):
+                logger.exception("Browser launch error")
+                logger.info("Possible solutions:")
+                logger.info("   1. Install Playwright browsers: playwright install chromium")
+                logger.info("   2. Check Chrome installation")
+                logger.info("   3. Run as administrator")
+            else:
+                logger.exception("Critical error in content processing or setup")
             return False
 
+        finally:
+            # Only the job's page is closed; the context stays warm for the next run
+            if page is not None:
+                with suppress(Exception):
+                    page.close()
+
+
+# Automation instances by (debug_mode, email, password hash); the plaintext
+# password is never part of the key
+_automations = {}
+_AUTOMATIONS_MAX = 8
+
+
+def _get_automation(
+    debug_mode: bool, email: Optional[str], password: Optional[str]
+) -> NotebookLMAutomation:
+    """Return one NotebookLMAutomation per configuration instead of one per call."""
+    password_hash = hashlib.sha256(password.encode("utf-8")).hexdigest() if password else None
+    key = (debug_mode, email, password_hash)
+    automation = _automations.get(key)
+    if automation is None:
+        if len(_automations) >= _AUTOMATIONS_MAX:
+            # Evict the oldest configuration (dicts keep insertion order)
+            _automations.pop(next(iter(_automations)))
+        automation = NotebookLMAutomation(debug_mode=debug_mode, email=email, password=password)
+        _automations[key] = automation
+    return automation
+
 
 def run_notebooklm_automation(
     content_source: str,
@@ -800,10 +1072,66 @@ def run_notebooklm_automation(
     Returns:
         bool: True if successful, False otherwise
     """
-    automation = NotebookLMAutomation(
-        debug_mode=debug_mode, email=email, password=password
+    return run_notebooklm_batch(
+        [content_source],
+        debug_mode=debug_mode,
+        max_wait_minutes=max_wait_minutes,
+        email=email,
+        password=password,
+    )[0]
+
+
+def run_notebooklm_batch(
+    contents: List[str],
+    debug_mode: bool = False,
+    max_wait_minutes: int = 15,
+    email: Optional[str] = None,
+    password: Optional[str] = None,
+) -> List[bool]:
+    """
+    Run the NotebookLM workflow for several texts in one browser session.
+
+    The browser is launched and signed in once; each text then gets its own
+    page in the same context, so only the first item pays for startup and login.
+
+    Args:
+        contents: Text contents to convert to audio, processed in order
+        debug_mode: Enable debug screenshots and logs
+        max_wait_minutes: Maximum wait time for each audio generation
+        email: Google account email (optional, for login)
+        password: Google account password (optional, for login)
+
+    Returns:
+        list[bool]: Success flag for each item in contents
+    """
+    automation = _get_automation(debug_mode, email, password)
+    return [
+        automation.run_automation(content_source, max_wait_minutes)
+        for content_source in contents
+    ]
+
+
+# Sync Playwright objects are bound to the thread that launched them, and the
+# shared browser (see NotebookLMAutomation.get_context) outlives each run, so
+# every automation call goes through this one worker thread
+_automation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notebooklm")
+
+
+async def run_in_automation_thread(func, *args, **kwargs):
+    """Run a blocking automation call on the automation thread without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _automation_executor, functools.partial(func, *args, **kwargs)
     )
-    return automation.run_automation(content_source, max_wait_minutes)
+
+
+async def shutdown_automation() -> None:
+    """Close the shared browser on the automation thread that owns it.
+
+    Call from the app's shutdown hook; an atexit handler would run on the
+    main thread, where the sync Playwright objects cannot be used.
+    """
+    await run_in_automation_thread(NotebookLMAutomation.close_context)
 
 
 if __name__ == "__main__":
@@ -5,20 +5,44 @@ from .api.models import router as models_router
 from .api.audio_generation import router as audio_generation_router
 from .api.foxai import router as foxai_router
 from dotenv import load_dotenv
+import atexit
+import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from contextlib import asynccontextmanager
+from .core.flow.automate import shutdown_automation
 from .utils.log_cleaner import LogCleaner
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Configure the app's module loggers (automation, login, log cleaner) once.
+# Only this package's logger is touched, so library and server logging keep
+# whatever level and handlers uvicorn/gunicorn gave them. Records are queued
+# and written by a listener thread, so console I/O never blocks the
+# automation or request threads
+_log_queue = queue.SimpleQueue()
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(logging.Formatter("%(asctime)s %(threadName)s %(message)s"))
+_log_listener = QueueListener(_log_queue, _console_handler)
+_app_logger = logging.getLogger(__package__)
+_app_logger.setLevel(logging.INFO)
+_app_logger.addHandler(QueueHandler(_log_queue))
+_app_logger.propagate = False
+# Write records from import time on and flush them at process exit, so
+# nothing logged outside the app's lifespan is left in the queue
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Clean old logs
     log_cleaner = LogCleaner(log_dir="logs", retention_days=3)
     log_cleaner.clean_old_logs()
     yield
-    # Shutdown: cleanup if needed
+    # Shutdown: close the shared NotebookLM browser on its own thread
+    await shutdown_automation()
 
 app = FastAPI(
     title="Text-to-Speech & Text Generation API",
@@ -3,13 +3,78 @@
 Google Account Login Process for NotebookLM Automation
 """
 
+import logging
 import os
-import time
+import re
 from playwright.sync_api import TimeoutError
 
+logger = logging.getLogger(__name__)
+
+# Label of the account-chooser entry that leads to the email form
+USE_ANOTHER_ACCOUNT_TEXT = re.compile(r"another.*account", re.IGNORECASE | re.DOTALL)
+
+# URLs Google redirects to once the sign-in itself has succeeded
+LOGIN_SUCCESS_INDICATORS = (
+    'accounts.google.com/signin/oauth',
+    'accounts.google.com/b/0/oauth',
+    'myaccount.google.com',
+    'accounts.google.com/manageaccount',
+)
+
+
+def login_finished(url):
+    """Return True once the URL shows the login flow is over."""
+    url = url.lower()
+    if any(indicator in url for indicator in LOGIN_SUCCESS_INDICATORS):
+        return True
+    return 'signin' not in url and 'login' not in url
+
+
 class GoogleLoginService:
     """Handle Google account login process for NotebookLM automation."""
 
+    # Selector fallbacks, built once instead of on every login
+    USE_ANOTHER_ACCOUNT_SELECTORS = (
+        ".riDSKb:has-text('Use another account')",
+        "div.riDSKb:has-text('Use another account')",
+        ".riDSKb",
+        "#yDmH0d > c-wiz > main > div.UXFQgc > div > div > div > form > span > section > div > div > div > div > ul > li:nth-child(2) > div > div > div.riDSKb",
+        "div:has-text('Use another account')",
+        "button:has-text('Use another account')",
+        "[data-identifier='UseAnotherAccount']",
+    )
+
+    # Google's own ids, tried before the generic fallbacks below
+    EMAIL_PRIMARY_SELECTOR = "#identifierId"
+    EMAIL_NEXT_PRIMARY_SELECTOR = "#identifierNext button"
+
+    EMAIL_SELECTORS = (
+        'input[type="email"]#identifierId',
+        'input[type="email"].whsOnd.zHQkBf#identifierId',
+        'input[name="identifier"]',
+        'input#identifierId',
+        'input[type="email"]',
+        'input[aria-label*="Email"]',
+        'input[placeholder*="email"]',
+    )
+
+    EMAIL_NEXT_SELECTORS = (
+        "#identifierNext > div > button",
+        "#identifierNext button",
+        "button:has-text('Next')",
+        "[data-primary-action-label='Next'] button",
+        "button[type='submit']",
+        ".VfPpkd-LgbsSe:has-text('Next')",
+    )
+
+    TWO_FA_SELECTORS = (
+        "div:has-text('2-Step Verification')",
+        "div:has-text('Verify it\\'s you')",
+        "div:has-text('Get a verification code')",
+        "input[aria-label*='verification']",
+        "input[placeholder*='code']",
+    )
+
     def __init__(self, debug_mode=False):
         """Initialize login service."""
         self.debug_mode = debug_mode
@@ -20,216 +85,160 @@ class GoogleLoginService:
             return
 
         try:
-            print(f"\n🔍 Login Debug - {step_name}:")
-            print(f"   URL: {page.url}")
-            print(f"   Title: {page.title()}")
-
-            # Check for common login elements
-            email_input = page.locator('input[type="email"]').count()
-            password_input = page.locator('input[type="password"]').count()
-            buttons = page.locator('button').count()
-
-            print(f"   Email inputs: {email_input}")
-            print(f"   Password inputs: {password_input}")
-            print(f"   Buttons: {buttons}")
-
-            if self.debug_mode:
-                screenshot_path = f"login_debug_{step_name}.png"
-                page.screenshot(path=screenshot_path)
-                print(f"   Screenshot: {screenshot_path}")
+            # Title and common login element counts in one round-trip
+            state = page.evaluate("""() => ({
+                title: document.title,
+                emailInputs: document.querySelectorAll('input[type="email"]').length,
+                passwordInputs: document.querySelectorAll('input[type="password"]').length,
+                buttons: document.querySelectorAll('button').length,
+            })""")
+
+            logger.info(f"🔍 Login Debug - {step_name}:")
+            logger.info(f"   URL: {page.url}")
+            logger.info(f"   Title: {state['title']}")
+            logger.info(f"   Email inputs: {state['emailInputs']}")
+            logger.info(f"   Password inputs: {state['passwordInputs']}")
+            logger.info(f"   Buttons: {state['buttons']}")
+
+            # Viewport JPEG: much cheaper to encode than a PNG
+            screenshot_path = f"login_debug_{step_name}.jpg"
+            page.screenshot(path=screenshot_path, type="jpeg", quality=60, full_page=False)
+            logger.info(f"   Screenshot: {screenshot_path}")
 
         except Exception as e:
-            print(f"⚠️ Login debug error: {e}")
+            logger.warning(f"⚠️ Login debug error: {e}")
+
+    def find_preferred(self, page, primary, fallbacks, timeout=10000):
+        """Wait for the primary selector, then fall back to the joined fallbacks.
+
+        A comma-joined union matches in DOM order, so a generic entry such as
+        any submit button could win over the specific one; the union is only
+        tried once the primary selector has not shown up. Returns None if
+        neither does.
+        """
+        for selectors, wait in ((primary, timeout), (", ".join(fallbacks), 3000)):
+            target = page.locator(selectors).filter(visible=True).first
+            try:
+                target.wait_for(state="visible", timeout=wait)
+                return target
+            except TimeoutError:
+                continue
+        return None
+
+    def wait_for_email_input(self, page, timeout=10000):
+        """Wait for the email step to render after switching accounts."""
+        try:
+            page.locator('input[type="email"]').first.wait_for(state="visible", timeout=timeout)
+        except TimeoutError:
+            pass  # enter_email reports the missing field
 
     def click_use_another_account(self, page):
         """Click 'Use another account' button if present."""
         try:
-            print("🔄 Looking for 'Use another account' option...")
+            logger.info("🔄 Looking for 'Use another account' option...")
 
             # Debug: Show page content to understand structure
             if self.debug_mode:
-                print("📱 Checking for riDSKb elements...")
-                riDSKb_elements = page.locator(".riDSKb").count()
-                print(f"   Found {riDSKb_elements} elements with class 'riDSKb'")
-
-                if riDSKb_elements > 0:
-                    for i in range(riDSKb_elements):
-                        text = page.locator(".riDSKb").nth(i).text_content()
-                        print(f"   riDSKb[{i}]: '{text}'")
-
-            # Try multiple selectors for 'Use another account'
-            selectors = [
-                ".riDSKb:has-text('Use another account')",
-                "div.riDSKb:has-text('Use another account')",
-                ".riDSKb",
-                "#yDmH0d > c-wiz > main > div.UXFQgc > div > div > div > form > span > section > div > div > div > div > ul > li:nth-child(2) > div > div > div.riDSKb",
-                "div:has-text('Use another account')",
-                "button:has-text('Use another account')",
-                "[data-identifier='UseAnotherAccount']"
-            ]
-
-            # Try all selectors
-            for selector in selectors:
+                logger.info("📱 Checking for riDSKb elements...")
+                riDSKb_texts = page.locator(".riDSKb").all_text_contents()
+                logger.info(f"   Found {len(riDSKb_texts)} elements with class 'riDSKb'")
+                for i, text in enumerate(riDSKb_texts):
+                    logger.info(f"   riDSKb[{i}]: '{text}'")
+
+            # Try all selectors for 'Use another account'; the text check runs
+            # inside the locator, so each miss costs a single visibility probe
+            for selector in self.USE_ANOTHER_ACCOUNT_SELECTORS:
                 try:
-                    print(f"🔍 Trying selector: {selector}")
                     btn = page.locator(selector)
-                    count = btn.count()
-                    print(f"   Found {count} elements")
-
-                    if count > 0:
-                        # Check text content before clicking
-                        text = btn.first.text_content() or ""
-                        print(f"   Element text: '{text}'")
+                    # Only click if element contains relevant text or is .riDSKb
+                    if selector != ".riDSKb":
+                        btn = btn.filter(has_text=USE_ANOTHER_ACCOUNT_TEXT)
+                    btn = btn.first
 
-                        # Only click if element contains relevant text or is .riDSKb
-                        if ("another" in text.lower() and "account" in text.lower()) or selector == ".riDSKb":
-                            btn.first.click(force=True)
-                            print(f"✅ Clicked 'Use another account' using: {selector}")
-                            page.wait_for_timeout(3000)  # Wait longer for page transition
+                    if not btn.is_visible():
+                        continue
 
-                            # Verify we moved to a different page/state
-                            current_url = page.url
-                            print(f"   Current URL after click: {current_url}")
+                    btn.click(force=True)
+                    logger.info(f"✅ Clicked 'Use another account' using: {selector}")
+                    self.wait_for_email_input(page)
 
-                            return True
-                        else:
-                            print(f"   ⏭️ Skipped - text doesn't match: '{text}'")
+                    # Verify we moved to a different page/state
+                    logger.info(f"   Current URL after click: {page.url}")
+                    return True
 
                 except Exception as e:
-                    print(f"   ❌ Failed with {selector}: {e}")
+                    logger.error(f"   ❌ Failed with {selector}: {e}")
                     continue
 
-            # Final attempt: Click any .riDSKb element that might be the right one
-            try:
-                riDSKb_elements = page.locator(".riDSKb")
-                for i in range(riDSKb_elements.count()):
-                    element = riDSKb_elements.nth(i)
-                    text = element.text_content() or ""
-                    if "another" in text.lower() or "account" in text.lower():
-                        element.click()
-                        print(f"✅ Clicked riDSKb element with matching text: '{text}'")
-                        page.wait_for_timeout(2000)
-                        return True
-            except Exception as e:
-                print(f"⚠️ Final attempt failed: {e}")
-
-            print("ℹ️ 'Use another account' button not found - proceeding")
+            logger.info("ℹ️ 'Use another account' button not found - proceeding")
             return True
 
         except Exception as e:
-            print(f"⚠️ Error clicking 'Use another account': {e}")
+            logger.warning(f"⚠️ Error clicking 'Use another account': {e}")
             return True  # Continue anyway
 
     def enter_email(self, page, email):
         """Enter email address."""
         try:
-            print("📧 Entering email address...")
-
-            # Try multiple selectors for email input
-            email_selectors = [
-                'input[type="email"]#identifierId',
-                'input[type="email"].whsOnd.zHQkBf#identifierId',
-                'input[name="identifier"]',
-                'input#identifierId',
-                'input[type="email"]',
-                'input[aria-label*="Email"]',
-                'input[placeholder*="email"]'
-            ]
-
-            email_input = None
-            for selector in email_selectors:
-                try:
-                    print(f"🔍 Trying email selector: {selector}")
-                    input_elem = page.locator(selector)
-                    count = input_elem.count()
-                    print(f"   Found {count} email input elements")
-
-                    if count > 0:
-                        input_elem.first.wait_for(timeout=3000000)
-                        email_input = input_elem.first
-                        print(f"✅ Found email input with: {selector}")
-                        break
-                except Exception as e:
-                    print(f"   ❌ Failed with {selector}: {e}")
-                    continue
-
-            if not email_input:
-                print("❌ No email input field found with any selector")
+            logger.info("📧 Entering email address...")
+
+            email_input = self.find_preferred(
+                page, self.EMAIL_PRIMARY_SELECTOR, self.EMAIL_SELECTORS
+            )
+            if email_input is not None:
+                logger.info("✅ Found email input")
+            else:
+                logger.error("❌ No email input field found with any selector")
                 self.debug_login_state(page, "email_input_not_found")
                 return False
 
             # Clear and enter email
-            print("✍️ Filling email...")
+            logger.info("✍️ Filling email...")
             email_input.click()
-            page.wait_for_timeout(500)
             email_input.clear()
-            page.wait_for_timeout(500)
             email_input.fill(email)
-            page.wait_for_timeout(1000)
 
-            print(f"✅ Email entered: {email}")
+            logger.info(f"✅ Email entered: {email}")
             self.debug_login_state(page, "after_email_input")
             return True
 
         except Exception as e:
-            print(f"❌ Error entering email: {e}")
+            logger.error(f"❌ Error entering email: {e}")
             self.debug_login_state(page, "email_error")
             return False
 
     def click_next_after_email(self, page):
         """Click Next button after entering email."""
         try:
-            print("➡️ Clicking Next after email...")
-
-            # Try multiple selectors for Next button
-            next_selectors = [
-                "#identifierNext > div > button",
-                "#identifierNext button",
-                "button:has-text('Next')",
-                "[data-primary-action-label='Next'] button",
-                "button[type='submit']",
-                ".VfPpkd-LgbsSe:has-text('Next')"
-            ]
-
-            next_btn = None
-            for selector in next_selectors:
-                try:
-                    print(f"🔍 Trying Next selector: {selector}")
-                    btn_elem = page.locator(selector)
-                    count = btn_elem.count()
-                    print(f"   Found {count} Next button elements")
-
-                    if count > 0:
-                        btn_elem.first.wait_for(timeout=3000000)
-                        next_btn = btn_elem.first
-                        print(f"✅ Found Next button with: {selector}")
-                        break
-                except Exception as e:
-                    print(f"   ❌ Failed with {selector}: {e}")
-                    continue
-
-            if not next_btn:
-                print("❌ No Next button found with any selector")
+            logger.info("➡️ Clicking Next after email...")
+
+            next_btn = self.find_preferred(
+                page, self.EMAIL_NEXT_PRIMARY_SELECTOR, self.EMAIL_NEXT_SELECTORS
+            )
+            if next_btn is not None:
+                logger.info("✅ Found Next button")
+            else:
+                logger.error("❌ No Next button found with any selector")
                 self.debug_login_state(page, "next_button_not_found")
                 return False
 
             # Click the button
-            print("🖱️ Clicking Next button...")
+            logger.info("🖱️ Clicking Next button...")
             next_btn.click()
-            print("✅ Next button clicked")
-            page.wait_for_timeout(4000)  # Wait longer for password page
+            logger.info("✅ Next button clicked")
+            # enter_password waits for the password field itself
             self.debug_login_state(page, "after_email_next")
             return True
 
         except Exception as e:
-            print(f"❌ Error clicking Next after email: {e}")
+            logger.error(f"❌ Error clicking Next after email: {e}")
             self.debug_login_state(page, "next_error")
             return False
 
     def enter_password(self, page, password):
         """Enter password."""
         try:
-            print("🔐 Entering password...")
+            logger.info("🔐 Entering password...")
 
             # Wait for password input field
             password_input = page.locator('input[type="password"].whsOnd.zHQkBf[name="Passwd"]')
@@ -239,152 +248,131 @@ class GoogleLoginService:
             password_input.click()
             password_input.clear()
             password_input.fill(password)
-            page.wait_for_timeout(1000)
 
-            print("✅ Password entered")
+            logger.info("✅ Password entered")
             self.debug_login_state(page, "after_password_input")
             return True
 
         except TimeoutError:
-            print("❌ Password input field not found")
+            logger.error("❌ Password input field not found")
             return False
         except Exception as e:
-            print(f"❌ Error entering password: {e}")
+            logger.error(f"❌ Error entering password: {e}")
             return False
 
     def click_next_after_password(self, page):
         """Click Next button after entering password."""
         try:
-            print("➡️ Clicking Next after password...")
+            logger.info("➡️ Clicking Next after password...")
 
             # Use the specific selector provided
             next_btn = page.locator("#passwordNext > div > button")
             next_btn.wait_for(timeout=8000)
             next_btn.click()
 
-            print("✅ Password Next button clicked", flush=True)
-            page.wait_for_timeout(5000)  # Wait 5 seconds for login to complete
+            logger.info("✅ Password Next button clicked")
+            # Wait for the password step to go away instead of a fixed 5 seconds
+            try:
+                page.locator('input[name="Passwd"]').wait_for(state="hidden", timeout=10000)
+            except TimeoutError:
+                pass  # Still on the password page; completion check decides
             self.debug_login_state(page, "after_password_next")
             return True
 
         except TimeoutError:
-            print("❌ Next button not found after password")
+            logger.error("❌ Next button not found after password")
             return False
         except Exception as e:
-            print(f"❌ Error clicking Next after password: {e}")
+            logger.error(f"❌ Error clicking Next after password: {e}")
             return False
 
     def wait_for_login_completion(self, page, max_wait_seconds=30):
         """Wait for login to complete."""
-        print("⏳ Waiting for login completion...")
-
-        start_time = time.time()
-
-        while time.time() - start_time < max_wait_seconds:
-            try:
-                current_url = page.url
-
-                # Check if we're redirected to a success page or main Google page
-                if any(indicator in current_url.lower() for indicator in [
-                    'accounts.google.com/signin/oauth',
-                    'accounts.google.com/b/0/oauth',
-                    'myaccount.google.com',
-                    'accounts.google.com/ManageAccount'
-                ]):
-                    print("✅ Login appears successful - redirected")
-                    return True
+        logger.info("⏳ Waiting for login completion...")
 
-                # Check if we're no longer on login page
-                if 'signin' not in current_url.lower() and 'login' not in current_url.lower():
-                    print("✅ Login completed - left login pages")
-                    return True
-
-                page.wait_for_timeout(2000)
-
-            except Exception as e:
-                print(f"⚠️ Error checking login status: {e}")
-                break
-
-        print("⚠️ Login completion timeout")
+        # Wake on the redirect itself instead of polling the URL every 2 seconds
+        try:
+            page.wait_for_url(login_finished, timeout=max_wait_seconds * 1000)
+            logger.info("✅ Login completed - left login pages")
+            return True
+        except TimeoutError:
+            logger.warning("⚠️ Login completion timeout")
+        except Exception as e:
+            logger.warning(f"⚠️ Error checking login status: {e}")
         return False
 
     def handle_two_factor_auth(self, page):
         """Handle two-factor authentication if required."""
         try:
-            print("🔐 Checking for 2FA requirements...")
+            logger.info("🔐 Checking for 2FA requirements...")
 
             # Look for 2FA prompts
-            two_fa_selectors = [
-                "div:has-text('2-Step Verification')",
-                "div:has-text('Verify it\\'s you')",
-                "div:has-text('Get a verification code')",
-                "input[aria-label*='verification']",
-                "input[placeholder*='code']"
-            ]
-
-            for selector in two_fa_selectors:
+            for selector in self.TWO_FA_SELECTORS:
                 if page.locator(selector).count() > 0:
-                    print("⚠️ 2FA required - manual intervention needed")
-                    print("Please complete 2FA manually in the browser")
-
-                    # Wait for user to complete 2FA
-                    print("Waiting 120 seconds for manual 2FA completion...")
-                    page.wait_for_timeout(120000)
+                    logger.warning("⚠️ 2FA required - manual intervention needed")
+                    logger.info("Please complete 2FA manually in the browser")
+
+                    # Wait for user to complete 2FA (returns as soon as they do)
+                    logger.info("Waiting up to 120 seconds for manual 2FA completion...")
+                    try:
+                        page.wait_for_url(login_finished, timeout=120000)
+                    except TimeoutError:
+                        pass  # wait_for_login_completion reports the timeout
                     return True
 
-            print("ℹ️ No 2FA detected")
+            logger.info("ℹ️ No 2FA detected")
             return True
 
         except Exception as e:
-            print(f"⚠️ Error handling 2FA: {e}")
+            logger.warning(f"⚠️ Error handling 2FA: {e}")
             return True
 
     def login_to_google(self, page, email, password):
         """Complete Google login process."""
         try:
-            print("🔐 Starting Google login process...")
-            print("=" * 50)
+            logger.info("🔐 Starting Google login process...")
+            logger.info("=" * 50)
 
             # Step 1: Handle "Use another account" if present
             if not self.click_use_another_account(page):
-                print("❌ Failed to handle account selection")
+                logger.error("❌ Failed to handle account selection")
                 return False
 
             # Step 2: Enter email
             if not self.enter_email(page, email):
-                print("❌ Failed to enter email")
+                logger.error("❌ Failed to enter email")
                 return False
 
             # Step 3: Click Next after email
             if not self.click_next_after_email(page):
-                print("❌ Failed to proceed after email")
+                logger.error("❌ Failed to proceed after email")
                 return False
 
             # Step 4: Enter password
             if not self.enter_password(page, password):
-                print("❌ Failed to enter password")
+                logger.error("❌ Failed to enter password")
                 return False
 
             # Step 5: Click Next after password
             if not self.click_next_after_password(page):
-                print("❌ Failed to proceed after password")
+                logger.error("❌ Failed to proceed after password")
                 return False
 
             # Step 6: Handle 2FA if needed
             if not self.handle_two_factor_auth(page):
-                print("❌ Failed to handle 2FA")
+                logger.error("❌ Failed to handle 2FA")
                 return False
 
             # Step 7: Wait for login completion
             if not self.wait_for_login_completion(page):
-                print("❌ Login did not complete in time")
+                logger.error("❌ Login did not complete in time")
                 return False
 
-            print("✅ Google login completed successfully!")
+            logger.info("✅ Google login completed successfully!")
             return True
 
         except Exception as e:
-            print(f"❌ Login process error: {e}")
+            logger.error(f"❌ Login process error: {e}")
             return False
 
 def perform_google_login(page, email, password, debug_mode=False):
@@ -20,15 +20,17 @@ class LogCleaner:
             cutoff_time = time.time() - (self.retention_days * 24 * 60 * 60)
             deleted_count = 0
             
-            for log_file in self.log_dir.glob("*.log"):
-                try:
-                    file_mtime = os.path.getmtime(log_file)
-                    if file_mtime < cutoff_time:
-                        log_file.unlink()
-                        deleted_count += 1
-                        logger.info(f"Deleted old log file: {log_file.name}")
-                except Exception as e:
-                    logger.error(f"Error deleting log file {log_file.name}: {e}")
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".log"):
+                        continue
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff_time:
+                            os.unlink(entry.path)
+                            deleted_count += 1
+                            logger.info(f"Deleted old log file: {entry.name}")
+                    except Exception as e:
+                        logger.error(f"Error deleting log file {entry.name}: {e}")
             
             if deleted_count > 0:
                 logger.info(f"Cleaned {deleted_count} old log files (older than {self.retention_days} days)")
@@ -2,6 +2,7 @@
 """
 Test NotebookLM automation với browser hiện ra để login lần đầu
 """
+import logging
 import sys
 import os
 
@@ -14,6 +15,9 @@ sys.path.insert(0, src_path)
 from src.app.core.flow.automate import run_notebooklm_automation
 
 if __name__ == "__main__":
+    # Automation progress is reported through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("=" * 60)
     print("Testing NotebookLM Automation - Browser will appear")
     print("=" * 60)